@@ -1,4 +1,3 @@
-import json
 from ..Generated.AttributeTypes import Model as AttributeTypes
 from ..Helper.Helper import Helper
 import logging
@@ -7,18 +6,26 @@ logger = logging.getLogger(__name__)
 
 
 class AttributeTypesFactory:
-    json: json = None
+    json: dict = None
     attribute_types_object: object = None
-    errors: list = []
+    errors: list = None
     log_level: logging.log = None
 
     def __init__(self, path: str, log_level: logging.log = logging.INFO) -> None:
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         try:
             self.logger = Helper.start_logger(
                 self.__class__.__name__, log_level=log_level
             )
             self.json = Helper.read_json(path)
             self.attribute_types_object = self.__get_object()
+            # Name lookup built once so get_attribute resolves in O(1)
+            # instead of scanning the item list per call.
+            self.__items_by_name: dict[str, AttributeTypes] = {
+                item.name: item for item in self.attribute_types_object.items
+            }
 
         except Exception as e:
             self.__error_handler(str(e))
@@ -29,17 +36,14 @@ class AttributeTypesFactory:
 
     def __get_object(self) -> object:
 
-        __object = AttributeTypes.model_validate_json(json.dumps(self.json))
+        __object = AttributeTypes.model_validate(self.json)
 
         return __object
 
     def get_attribute(self, attribute_name) -> AttributeTypes:
 
         try:
-            __attribute_item = None
-            __attribute_item = [
-                i for i in self.attribute_types_object.items if i.name == attribute_name
-            ][0]
+            __attribute_item = self.__items_by_name[attribute_name]
 
             if __attribute_item is None:
                 self.__error_handler(
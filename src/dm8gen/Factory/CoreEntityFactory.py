@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from ..Generated.CoreModelEntry import Model as Core
 from ..Helper.Helper import Helper
 import logging
@@ -10,10 +10,10 @@ class CoreEntityFactory:
     """Factory class for Core Entities."""
 
     file_path: str = None
-    model_json: json = None
+    model_json: dict = None
     model_object: Core = None
     model_type: str = None
-    errors: list = []
+    errors: list = None
     log_level: logging.log = None
 
     def __init__(self, path: str, log_level: logging.log = logging.INFO) -> None:
@@ -23,18 +23,21 @@ class CoreEntityFactory:
             path (str): The path to the file.
             log_level (logging.log, optional): The logging level. Defaults to logging.INFO.
         """
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         try:
             self.logger: logging.Logger = Helper.start_logger(
                 self.__class__.__name__, log_level=log_level
             )
             self.file_path = path
             self.model_json = Helper.read_json(self.file_path)
-            self.model_object = Core.model_validate_json(json.dumps(self.model_json))
+            self.model_object = Core.model_validate(self.model_json)
             self.model_type = self.model_object.type.value
         except Exception as e:
             self.__error_handler(str(e))
 
-    @property
+    @cached_property
     def locator(self) -> str:
         """Get the locator.
 
@@ -1,4 +1,3 @@
-import json
 from ..Generated.DataModules import Model as DataModules
 from ..Helper.Helper import Helper
 import logging
@@ -7,18 +6,26 @@ logger = logging.getLogger(__name__)
 
 
 class DataModuleFactory:
-    json: json = None
+    json: dict = None
     data_module_object: object = None
-    errors: list = []
+    errors: list = None
     log_level: logging.log = None
 
     def __init__(self, path: str, log_level: logging.log = logging.INFO) -> None:
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         try:
             self.logger: logging.Logger = Helper.start_logger(
                 self.__class__.__name__, log_level=log_level
             )
             self.json = Helper.read_json(path)
             self.data_module_object = self.__get_object()
+            # Name lookup built once so get_data_module resolves in O(1)
+            # instead of scanning the item list per call.
+            self.__items_by_name: dict[str, DataModules] = {
+                item.name: item for item in self.data_module_object.items
+            }
 
         except Exception as e:
             self.__error_handler(str(e))
@@ -29,17 +36,14 @@ class DataModuleFactory:
 
     def __get_object(self) -> object:
 
-        __object = DataModules.model_validate_json(json.dumps(self.json))
+        __object = DataModules.model_validate(self.json)
 
         return __object
 
     def get_data_module(self, data_module_name) -> DataModules:
 
         try:
-            __data_module_item = None
-            __data_module_item = [
-                i for i in self.data_module_object.items if i.name == data_module_name
-            ][0]
+            __data_module_item = self.__items_by_name[data_module_name]
 
             if __data_module_item is None:
                 self.__error_handler(f"Found no item for module: {data_module_name}")
@@ -1,4 +1,3 @@
-import json
 from ..Generated.DataProducts import Model as DataProducts
 from ..Helper.Helper import Helper
 import logging
@@ -9,9 +8,9 @@ logger = logging.getLogger(__name__)
 class DataproductFactory:
     """Factory class for Data Products."""
 
-    json: json = None
+    json: dict = None
     data_product_object: object = None
-    errors: list = []
+    errors: list = None
     log_level: logging.log = None
 
     def __init__(self, path: str, log_level: logging.log = logging.INFO) -> None:
@@ -21,12 +20,20 @@ class DataproductFactory:
             path (str): The path to the file.
             log_level (logging.log, optional): The logging level. Defaults to logging.INFO.
         """
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         try:
             self.logger: logging.Logger = Helper.start_logger(
                 self.__class__.__name__, log_level=log_level
             )
             self.json = Helper.read_json(path)
             self.data_product_object = self.__get_object()
+            # Name lookup built once so get_data_product resolves in O(1)
+            # instead of scanning the item list per call.
+            self.__items_by_name: dict[str, DataProducts] = {
+                item.name: item for item in self.data_product_object.items
+            }
 
         except Exception as e:
             self.__error_handler(str(e))
@@ -46,7 +53,7 @@ class DataproductFactory:
         Returns:
             object: The data product object.
         """
-        __object = DataProducts.model_validate_json(json.dumps(self.json))
+        __object = DataProducts.model_validate(self.json)
         return __object
 
     def get_data_product(self, data_product_name) -> DataProducts:
@@ -59,10 +66,7 @@ class DataproductFactory:
             DataProduct: The data product.
         """
         try:
-            __data_product_item = None
-            __data_product_item = [
-                i for i in self.data_product_object.items if i.name == data_product_name
-            ][0]
+            __data_product_item = self.__items_by_name[data_product_name]
 
             if __data_product_item is None:
                 self.__error_handler(f"Found no item for product: {data_product_name}")
@@ -1,4 +1,4 @@
-import json
+import sys
 from ..Generated.DataSources import Model as DataSources
 from ..Helper.Helper import Helper
 import logging
@@ -11,9 +11,9 @@ class DataSourceFactory:
 
     CACHE_MAPPING: dict = {}
 
-    json: json = None
+    json: dict = None
     source_object: object = None
-    errors: list = []
+    errors: list = None
     log_level: logging.log = None
 
     def __init__(
@@ -25,16 +25,55 @@ class DataSourceFactory:
             path (str): The path to the file.
             log_level (logging.log, optional): The logging level. Defaults to logging.INFO.
         """
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         try:
             self.logger: logging.Logger = Helper.start_logger(
                 self.__class__.__name__, log_level=log_level
             )
             self.json = Helper.read_json(path)
             self.source_object = self.__get_object()
+            # Name lookup built once so get_datasource resolves in O(1)
+            # instead of scanning the item list per call.
+            # Keys are interned: templates look the same handful of
+            # names and type strings up over and over, and interned
+            # strings compare by pointer on a dict hit. The model
+            # fields are optional, so None values pass through
+            # unchanged instead of tripping sys.intern.
+            self.__items_by_name: dict[str, DataSources] = {
+                self.__intern(item.name): item
+                for item in self.source_object.items
+            }
+            # Type mappings per source, keyed sourceType -> target types;
+            # get_datasource_target_type otherwise rescans the mapping
+            # list for every uncached (source, type) pair. Lists keep
+            # ambiguous duplicate mappings detectable.
+            self.__mapping_by_source: dict[str, dict[str, list[str]]] = {}
+            for item in self.source_object.items:
+                by_type = self.__mapping_by_source.setdefault(
+                    self.__intern(item.name), {}
+                )
+                for mapping in item.dataTypeMapping or []:
+                    by_type.setdefault(
+                        self.__intern(mapping.sourceType), []
+                    ).append(self.__intern(mapping.targetType))
 
         except Exception as e:
             self.__error_handler(e)
 
+    @staticmethod
+    def __intern(value):
+        """Intern string values, passing anything else through.
+
+        Args:
+            value: The value to intern.
+
+        Returns:
+            The interned string, or the value unchanged if it is not a str.
+        """
+        return sys.intern(value) if isinstance(value, str) else value
+
     def __error_handler(self, msg: str):
         """Handle errors.
 
@@ -50,7 +89,7 @@ class DataSourceFactory:
         Returns:
             object: The data source object.
         """
-        __object = DataSources.model_validate_json(json.dumps(self.json))
+        __object = DataSources.model_validate(self.json)
         return __object
 
     def get_datasource(self, source_name) -> DataSources:
@@ -63,10 +102,7 @@ class DataSourceFactory:
             DataSource: The data source.
         """
         try:
-            __source_item = None
-            __source_item = [
-                i for i in self.source_object.items if i.name == source_name
-            ][0]
+            __source_item = self.__items_by_name[source_name]
 
             if __source_item is None:
                 self.__error_handler(
@@ -105,12 +141,9 @@ class DataSourceFactory:
             return DataSourceFactory.CACHE_MAPPING[cache_key]
 
         try:
-            __source_item = self.get_datasource(source_name=source_name)
-            __ls_target_type = [
-                i.targetType
-                for i in __source_item.dataTypeMapping
-                if i.sourceType == source_type
-            ]
+            __ls_target_type = self.__mapping_by_source.get(
+                source_name, {}
+            ).get(source_type, [])
             if len(__ls_target_type) == 1:
                 __target_type = __ls_target_type[0]
                 self.logger.debug(
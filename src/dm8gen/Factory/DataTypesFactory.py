@@ -1,5 +1,4 @@
 import sys
-import json
 
 from ..Generated.DataTypes import Model as DataTypes
 from ..Helper.Helper import Helper
@@ -11,9 +10,9 @@ logger = logging.getLogger(__name__)
 class DataTypesFactory:
     """Factory class for Data Types."""
 
-    json: json = None
+    json: dict = None
     data_types_object: object = None
-    errors: list = []
+    errors: list = None
     log_level: logging.log = None
 
     def __init__(self, path: str, log_level: logging.log = logging.INFO) -> None:
@@ -23,12 +22,24 @@ class DataTypesFactory:
             path (str): The path to the file.
             log_level (logging.log, optional): The logging level. Defaults to logging.INFO.
         """
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         try:
             self.logger: logging.Logger = Helper.start_logger(
                 self.__class__.__name__, log_level=log_level
             )
             self.json = Helper.read_json(path)
             self.data_types_object = self.__get_object()
+            # Lookup results are cached per (property_key, property_value)
+            # because templates resolve the same few data types once per
+            # column, which otherwise rescans the whole item list.
+            self.__list_cache: dict[tuple[str, str], list[DataTypes]] = {}
+            # Flat name lookup built once so get_data_type resolves in O(1)
+            # instead of scanning the item list per call.
+            self.__items_by_name: dict[str, list[DataTypes]] = {}
+            for item in self.data_types_object.items:
+                self.__items_by_name.setdefault(item.name, []).append(item)
 
         except Exception as e:
             self.__error_handler(str(e))
@@ -49,7 +60,7 @@ class DataTypesFactory:
         Returns:
             object: The data types object.
         """
-        __object = DataTypes.model_validate_json(json.dumps(self.json))
+        __object = DataTypes.model_validate(self.json)
         return __object
 
     def get_data_type(self, datatype_name: str) -> DataTypes:
@@ -63,11 +74,7 @@ class DataTypesFactory:
         """
         try:
             __data_type_item = None
-            __ls_mapping = [
-                i
-                for i in self.data_types_object.items
-                if getattr(i, "name") == datatype_name
-            ]
+            __ls_mapping = self.__items_by_name.get(datatype_name, [])
             __data_type_item = __ls_mapping[0]
 
             if len(__ls_mapping) == 0:
@@ -99,6 +106,10 @@ class DataTypesFactory:
             list[DataType]: A list of data types.
         """
         try:
+            cache_key = (property_key, property_value)
+            if cache_key in self.__list_cache:
+                return self.__list_cache[cache_key]
+
             __ls_mapping: list[DataTypes] = None
             __ls_mapping = [
                 i
@@ -106,6 +117,7 @@ class DataTypesFactory:
                 if getattr(i, property_key) == property_value
             ]
 
+            self.__list_cache[cache_key] = __ls_mapping
             return __ls_mapping
 
         except Exception as e:
@@ -1,4 +1,3 @@
-import json
 from ..Generated.RawModelEntry import Model as Raw
 from ..Generated.StageModelEntry import Model as Stage
 from ..Helper.Helper import Helper
@@ -11,10 +10,10 @@ class EntityFactory:
     """Factory class for Entities."""
 
     file_path: str = None
-    model_json: json = None
+    model_json: dict = None
     model_object: Raw = None
     model_type: str = None
-    errors: list = []
+    errors: list = None
     log_level: logging.log = None
 
     def __init__(self, path: str, log_level: logging.log = logging.INFO) -> None:
@@ -24,13 +23,16 @@ class EntityFactory:
             path (str): The path to the file.
             log_level (logging.log, optional): The logging level. Defaults to logging.INFO.
         """
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         try:
             self.logger: logging.Logger = Helper.start_logger(
                 self.__class__.__name__, log_level=log_level
             )
             self.file_path = path
             self.model_json = Helper.read_json(self.file_path)
-            self.model_object = Raw.model_validate_json(json.dumps(self.model_json))
+            self.model_object = Raw.model_validate(self.model_json)
             self.model_type = self.model_object.type.value
         except Exception as e:
             self.__error_handler(str(e))
@@ -53,9 +55,9 @@ class EntityFactory:
         """
         if self.model_type is not None:
             if self.entity_typ.lower() == "raw":
-                __entity_object = Raw.model_validate_json(json.dumps(self.json))
+                __entity_object = Raw.model_validate(self.model_json)
             elif self.entity_typ.lower() == "stage":
-                __entity_object = Stage.model_validate_json(json.dumps(self.model_json))
+                __entity_object = Stage.model_validate(self.model_json)
             else:
                 self.__error_handler(
                     f"No valid type found in file from path {self.file_path}"
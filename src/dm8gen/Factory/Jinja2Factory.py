@@ -5,6 +5,7 @@ import sys
 import os
 import json
 import textwrap
+from functools import cached_property
 
 from .Model import Model
 from autopep8 import fix_code
@@ -18,8 +19,7 @@ logger = logging.getLogger(__name__)
 class Jinja2Factory:
     """Factory class for Jinja2 templates."""
 
-    errors: list = []
-    logger: logging.Logger = None
+    errors: list = None
     model: Model = None
     log_level: logging.log = None
 
@@ -30,13 +30,24 @@ class Jinja2Factory:
             model (Model): The model object.
             log_level (logging.log, optional): The logging level. Defaults to logging.INFO.
         """
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         self.log_level = log_level
-        self.logger: logging.Logger = Helper.start_logger(
-            self.__class__.__name__, log_level=self.log_level
-        )
         self.model = model
+        # Output directories already ensured during this run; write_output
+        # is called once per template and most templates share target
+        # directories.
+        self.__created_dirs: set[str] = set()
         self.logger.debug("Successfully init Jinja2Factory")
 
+    @cached_property
+    def logger(self) -> logging.Logger:
+        # Configured on first use; start_logger is idempotent per name.
+        return Helper.start_logger(
+            self.__class__.__name__, log_level=self.log_level
+        )
+
     def get_errors(self) -> list:
         """Get errors.
 
@@ -64,14 +75,14 @@ class Jinja2Factory:
             path_template (str): The path to the template.
         """
         try:
-            ls_target_files = [
-                f
-                for f in glob.iglob(path_template + "**/**", recursive=True)
-                if os.path.isfile(f)
-            ]
-            for file in ls_target_files:
-                self.logger.debug(f"Removing Template: {os.path.basename(file)}")
-                os.remove(file)
+            # os.walk hands back files and directories already
+            # separated, so no per-entry isfile() stat is needed, and
+            # unlike the previous glob pattern it cannot match sibling
+            # directories that merely share the destination prefix.
+            for subdir, dirs, files in os.walk(path_template):
+                for file in files:
+                    self.logger.debug("Removing Template: %s", file)
+                    os.remove(os.path.join(subdir, file))
 
         except Exception as e:
             self.__error_handler(str(e))
@@ -193,11 +204,13 @@ class Jinja2Factory:
                     file_path = os.path.join(path_template_destination, file_name)
                     directory_name = os.path.dirname(file_path)
 
-                    if not os.path.exists(directory_name):
-                        os.makedirs(directory_name)
-                        self.logger.info(
-                            f"Created template target directory: {path_template_destination}"
-                        )
+                    if directory_name not in self.__created_dirs:
+                        if not os.path.exists(directory_name):
+                            os.makedirs(directory_name)
+                            self.logger.info(
+                                f"Created template target directory: {path_template_destination}"
+                            )
+                        self.__created_dirs.add(directory_name)
 
                     self.logger.debug(f"Opening file: {input_file_name}")
                     current_file = open(file_path, encoding="utf-8", mode="a")
@@ -274,26 +287,32 @@ class Jinja2Factory:
             _path_template_destination = os.path.abspath(path_template_destination)
 
             # Get List of jinja Template using globe for searching directories(Catch case for selecting a single jinja file)
+            # The *.jinja2 suffix is part of the glob pattern so that only
+            # template files are enumerated instead of listing the whole
+            # tree and filtering in Python afterwards.
             if os.path.isfile(_path_template_source):
                 ls_glob = [_path_template_source]
             else:
-                ls_glob = list(glob.glob(_path_template_source + "/**", recursive=True))
+                ls_glob = list(
+                    glob.glob(
+                        _path_template_source + "/**/*.jinja2", recursive=True
+                    )
+                )
 
             # Get final template list and filesystem loader list (ignore templates from collection folder if collection parameter ist used)
             if path_collections is not None:
                 _path_collections = os.path.abspath(path_collections)
                 ls_templates_source = list(
                     filter(
-                        lambda x: x.endswith("jinja2")
-                        and not os.path.abspath(x).startswith(_path_collections),
+                        lambda x: not os.path.abspath(x).startswith(
+                            _path_collections
+                        ),
                         ls_glob,
                     )
                 )
                 ls_filesystemloader = [_path_template_source, _path_collections]
             else:
-                ls_templates_source = list(
-                    filter(lambda x: x.endswith("jinja2"), ls_glob)
-                )
+                ls_templates_source = ls_glob
                 ls_filesystemloader = [_path_template_source]
 
             if path_solution is not None:
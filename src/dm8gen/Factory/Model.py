@@ -4,7 +4,10 @@ import re
 import sys
 from typing import Union
 from dataclasses import dataclass
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 import textwrap
+from pydantic import ValidationError
 from .RawEntityFactory import RawEntityFactory
 from .StageEntityFactory import StageEntityFactory
 from .CoreEntityFactory import CoreEntityFactory
@@ -15,42 +18,63 @@ from .DataModuleFactory import DataModuleFactory
 from .DataTypesFactory import DataTypesFactory
 from .EntityFactory import EntityFactory
 from ..Generated.Solution import Model as Solution
-from ..Generated.Index import Model as Index
+from ..Generated.Index import IndexEntry, Model as Index
 from ..Helper.Helper import Helper, JsonFileParseException
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Precompiled at import time so that the locator validation in
+# get_locator() does not re-compile the pattern on every call.
+_LOCATOR_CHECK_RE = re.compile(r"^/+.+/.+/.+/.+$")
+
 
 class Model:
     CACHE_DATA_SOURCE: dict = {}
     CACHE_ATTRIBUTE_TYPES: dict = {}
     CACHE_DATA_MODULE: dict = {}
     CACHE_DATA_TYPES: dict = {}
+    CACHE_ENTITY_FACTORY: dict = {}
+    CACHE_INDEX: dict = {}
 
     path_solution: str = None
     dict_solution: str = None
-    errors: list = []
+    errors: list = None
     log_level: logging.log = None
 
     def __init__(
         self, path_solution: str, log_level: logging.log = logging.INFO
     ):
+        # Per-instance error list; a class-level default would be
+        # shared by every instance of the class.
+        self.errors = []
         self.log_level = log_level
-        self.logger: logging.Logger = Helper.start_logger(
-            self.__class__.__name__, log_level=log_level
-        )
         self.path_solution = os.path.abspath(path_solution)
         self.dict_solution = os.path.dirname(self.path_solution)
         self.path_index = os.path.join(self.dict_solution, "index.json")
+        self.__solution: Solution = None
+        self.__index_items: list[tuple[str, str]] = None
+        self.__zone_paths: dict[str, str] = None
+
+    @cached_property
+    def logger(self) -> logging.Logger:
+        # Configured on first use so constructing a Model does not touch
+        # the logging setup; start_logger itself is idempotent per name.
+        return Helper.start_logger(
+            self.__class__.__name__, log_level=self.log_level
+        )
 
     @property
     def solution(self) -> Solution:
+        if self.__solution is not None:
+            return self.__solution
+
         try:
             solution_object = Solution.model_validate_json(
-                json.dumps(Helper.read_json(path=self.path_solution))
+                Helper.read_json_bytes(self.path_solution)
             )
             # self.logger.info('Successfully init Solution object')
+            self.__solution = solution_object
             return solution_object
         except Exception as e:
             self.__error_handler(e)
@@ -125,20 +149,28 @@ class Model:
     @property
     def data_sources(self) -> DataSourceFactory:
         path_datasource: str = os.path.join(
-            self.__get_dict_path(self.path_base), "DataSources.json"
+            self.path_base, "DataSources.json"
         )
 
-        if path_datasource in Model.CACHE_DATA_SOURCE:
-            self.logger.debug(
-                "Cached DataSourceFactory for %s" % path_datasource
+        try:
+            # Keyed by (path, mtime) so an edited file invalidates the
+            # cached factory automatically; getmtime on a missing base
+            # file goes through the error handler like any other
+            # factory failure.
+            cache_key = (
+                path_datasource,
+                os.path.getmtime(path_datasource),
             )
-            return Model.CACHE_DATA_SOURCE[path_datasource]
+            if cache_key in Model.CACHE_DATA_SOURCE:
+                self.logger.debug(
+                    "Cached DataSourceFactory for %s", path_datasource
+                )
+                return Model.CACHE_DATA_SOURCE[cache_key]
 
-        try:
             datasource_factory = DataSourceFactory(
                 path=path_datasource, log_level=self.log_level
             )
-            Model.CACHE_DATA_SOURCE[path_datasource] = datasource_factory
+            Model.CACHE_DATA_SOURCE[cache_key] = datasource_factory
             self.logger.info(
                 "Successfully init Datasource Factory from %s" % path_datasource
             )
@@ -150,21 +182,26 @@ class Model:
     @property
     def attribute_types(self) -> AttributeTypesFactory:
         path_attribute_types: str = os.path.join(
-            self.__get_dict_path(self.path_base), "AttributeTypes.json"
+            self.path_base, "AttributeTypes.json"
         )
-        if path_attribute_types in Model.CACHE_ATTRIBUTE_TYPES:
-            self.logger.debug(
-                "Cached AttributeTypesFactory for %s" % path_attribute_types
+        try:
+            # Keyed by (path, mtime) so an edited file invalidates the
+            # cached factory automatically.
+            cache_key = (
+                path_attribute_types,
+                os.path.getmtime(path_attribute_types),
             )
-            return Model.CACHE_ATTRIBUTE_TYPES[path_attribute_types]
+            if cache_key in Model.CACHE_ATTRIBUTE_TYPES:
+                self.logger.debug(
+                    "Cached AttributeTypesFactory for %s",
+                    path_attribute_types,
+                )
+                return Model.CACHE_ATTRIBUTE_TYPES[cache_key]
 
-        try:
             attribute_types_factory = AttributeTypesFactory(
                 path=path_attribute_types, log_level=self.log_level
             )
-            Model.CACHE_ATTRIBUTE_TYPES[path_attribute_types] = (
-                attribute_types_factory
-            )
+            Model.CACHE_ATTRIBUTE_TYPES[cache_key] = attribute_types_factory
             self.logger.info(
                 "Successfully init Attribute Factory from %s"
                 % path_attribute_types
@@ -177,19 +214,25 @@ class Model:
     @property
     def data_modules(self) -> DataModuleFactory:
         path_data_modules: str = os.path.join(
-            self.__get_dict_path(self.path_base), "DataModules.json"
+            self.path_base, "DataModules.json"
         )
-        if path_data_modules in Model.CACHE_DATA_MODULE:
-            self.logger.debug(
-                "Cached DataModuleFactory for %s" % path_data_modules
+        try:
+            # Keyed by (path, mtime) so an edited file invalidates the
+            # cached factory automatically.
+            cache_key = (
+                path_data_modules,
+                os.path.getmtime(path_data_modules),
             )
-            return Model.CACHE_DATA_MODULE[path_data_modules]
+            if cache_key in Model.CACHE_DATA_MODULE:
+                self.logger.debug(
+                    "Cached DataModuleFactory for %s", path_data_modules
+                )
+                return Model.CACHE_DATA_MODULE[cache_key]
 
-        try:
             data_modules_factory = DataModuleFactory(
                 path=path_data_modules, log_level=self.log_level
             )
-            Model.CACHE_DATA_MODULE[path_data_modules] = data_modules_factory
+            Model.CACHE_DATA_MODULE[cache_key] = data_modules_factory
             self.logger.info(
                 "Successfully init Data Module Factory from %s"
                 % path_data_modules
@@ -202,19 +245,25 @@ class Model:
     @property
     def data_types(self) -> DataTypesFactory:
         path_data_types: str = os.path.join(
-            self.__get_dict_path(self.path_base), "DataTypes.json"
+            self.path_base, "DataTypes.json"
         )
-        if path_data_types in Model.CACHE_DATA_TYPES:
-            self.logger.debug(
-                "Cached DataTypesFactory for %s" % path_data_types
+        try:
+            # Keyed by (path, mtime) so an edited file invalidates the
+            # cached factory automatically.
+            cache_key = (
+                path_data_types,
+                os.path.getmtime(path_data_types),
             )
-            return Model.CACHE_DATA_TYPES[path_data_types]
+            if cache_key in Model.CACHE_DATA_TYPES:
+                self.logger.debug(
+                    "Cached DataTypesFactory for %s", path_data_types
+                )
+                return Model.CACHE_DATA_TYPES[cache_key]
 
-        try:
             data_types_factory = DataTypesFactory(
                 path=path_data_types, log_level=self.log_level
             )
-            Model.CACHE_DATA_TYPES[path_data_types] = data_types_factory
+            Model.CACHE_DATA_TYPES[cache_key] = data_types_factory
             self.logger.info(
                 "Successfully init Data Types Factory from %s" % path_data_types
             )
@@ -232,87 +281,124 @@ class Model:
         return str(os.path.join(self.dict_solution, dict_item))
 
     def get_index(self) -> Index:
-        idx_json: json = Helper.read_json(self.path_index)
-        _idx = Index.model_validate_json(json.dumps(idx_json))
+        # The parsed index is cached per (path, mtime) so repeated calls
+        # within a run reuse it, while validate_index rewriting the file
+        # invalidates the entry automatically via the changed mtime.
+        cache_key = (self.path_index, os.path.getmtime(self.path_index))
+        if cache_key in Model.CACHE_INDEX:
+            return Model.CACHE_INDEX[cache_key]
+
+        # Feed the raw file bytes straight to pydantic instead of going
+        # through json.load followed by json.dumps of the same payload.
+        try:
+            with open(self.path_index, "rb") as f:
+                _idx = Index.model_validate_json(f.read())
+        except ValidationError as e:
+            raise JsonFileParseException(e, self.path_index)
+        Model.CACHE_INDEX[cache_key] = _idx
         return _idx
 
+    def __get_cached_entity_factory(self, factory_class, path: str):
+        # Entity factories are cached per (class, path) like the base
+        # factories above, so repeated lookups of the same entity during a
+        # generator run reuse the parsed model instead of re-reading the
+        # file and re-validating it.
+        cache_key = (factory_class.__name__, path)
+        if cache_key in Model.CACHE_ENTITY_FACTORY:
+            self.logger.debug(
+                "Cached %s for %s", factory_class.__name__, path
+            )
+            return Model.CACHE_ENTITY_FACTORY[cache_key]
+
+        factory = factory_class(path=path, log_level=self.log_level)
+        Model.CACHE_ENTITY_FACTORY[cache_key] = factory
+        return factory
+
     def get_raw_entity(self, path: str) -> RawEntityFactory:
         try:
-            return RawEntityFactory(path=path, log_level=self.log_level)
+            return self.__get_cached_entity_factory(RawEntityFactory, path)
         except Exception as e:
             self.__error_handler(e)
 
     def get_stage_entity(self, path: str) -> StageEntityFactory:
         try:
-            return StageEntityFactory(path=path, log_level=self.log_level)
+            return self.__get_cached_entity_factory(StageEntityFactory, path)
         except Exception as e:
             self.__error_handler(e)
 
     def get_core_entity(self, path: str) -> CoreEntityFactory:
         try:
-            return CoreEntityFactory(path=path, log_level=self.log_level)
+            return self.__get_cached_entity_factory(CoreEntityFactory, path)
         except Exception as e:
             self.__error_handler(e)
 
     def get_curated_entity(self, path: str) -> CuratedEntityFactory:
         try:
-            return CuratedEntityFactory(path=path, log_level=self.log_level)
+            return self.__get_cached_entity_factory(CuratedEntityFactory, path)
         except Exception as e:
             self.__error_handler(e)
 
     def get_entity(self, path: str) -> EntityFactory:
         try:
-            return EntityFactory(path=path, log_level=self.log_level)
+            return self.__get_cached_entity_factory(EntityFactory, path)
         except Exception as e:
             self.__error_handler(e)
 
-    def get_raw_entity_list(self) -> list[RawEntityFactory]:
-        ls_raw_entity = []
-        index = self.get_index()
+    def get_raw_entity_list(self, index: Index = None) -> list[RawEntityFactory]:
+        index = index or self.get_index()
 
-        for e in index.rawIndex.entry:
+        def __load(e) -> RawEntityFactory:
             self.logger.debug(
-                f"Added to raw entity list locator: {e.locator} file: {e.absPath}"
+                "Added to raw entity list locator: %s file: %s", e.locator, e.absPath
             )
-            ls_raw_entity.append(self.get_raw_entity(path=e.absPath))
+            return self.get_raw_entity(path=e.absPath)
 
-        return ls_raw_entity
+        # Entity files are independent, so read and validate them on a
+        # thread pool; map keeps the index order of the results.
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(__load, index.rawIndex.entry))
 
-    def get_stage_entity_list(self) -> list[StageEntityFactory]:
-        ls_stage_entity = []
-        index = self.get_index()
+    def get_stage_entity_list(
+        self, index: Index = None
+    ) -> list[StageEntityFactory]:
+        index = index or self.get_index()
 
-        for e in index.stageIndex.entry:
+        def __load(e) -> StageEntityFactory:
             self.logger.debug(
-                f"Added to stage entity list locator: {e.locator} file: {e.absPath}"
+                "Added to stage entity list locator: %s file: %s", e.locator, e.absPath
             )
-            ls_stage_entity.append(self.get_stage_entity(path=e.absPath))
+            return self.get_stage_entity(path=e.absPath)
 
-        return ls_stage_entity
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(__load, index.stageIndex.entry))
 
-    def get_core_entity_list(self) -> list[CoreEntityFactory]:
-        ls_core_entity = []
-        index = self.get_index()
+    def get_core_entity_list(
+        self, index: Index = None
+    ) -> list[CoreEntityFactory]:
+        index = index or self.get_index()
 
-        for e in index.coreIndex.entry:
+        def __load(e) -> CoreEntityFactory:
             self.logger.debug(
-                f"Added to core entity list locator: {e.locator} file: {e.absPath}"
+                "Added to core entity list locator: %s file: %s", e.locator, e.absPath
             )
-            ls_core_entity.append(self.get_core_entity(path=e.absPath))
+            return self.get_core_entity(path=e.absPath)
 
-        return ls_core_entity
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(__load, index.coreIndex.entry))
 
-    def get_curated_entity_list(self) -> list[CuratedEntityFactory]:
-        ls_curated_entity = []
-        index = self.get_index()
+    def get_curated_entity_list(
+        self, index: Index = None
+    ) -> list[CuratedEntityFactory]:
+        index = index or self.get_index()
 
-        for e in index.curatedIndex.entry:
+        def __load(e) -> CuratedEntityFactory:
             self.logger.debug(
-                f"Added to curated entity list locator: {e.locator} file: {e.absPath}"
+                "Added to curated entity list locator: %s file: %s", e.locator, e.absPath
             )
-            ls_curated_entity.append(self.get_curated_entity(path=e.absPath))
+            return self.get_curated_entity(path=e.absPath)
 
-        return ls_curated_entity
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(__load, index.curatedIndex.entry))
 
     def get_entity_list(
         self,
@@ -321,27 +407,32 @@ class Model:
         ls_entity = []
         for e in self.get_locator(regex=regex):
             self.logger.debug(
-                f"Added to raw entity list locator: {e.locator} file: {e.absPath}"
+                "Added to raw entity list locator: %s file: %s", e.locator, e.absPath
             )
             ls_entity.append(self.get_entity(path=e.absPath))
 
         return ls_entity
 
     def __get_index_items(self) -> list[tuple[str, str]]:
-        ls_index_items: list[tuple[str, str]] = [
-            ("rawIndex", self.path_raw),
-            ("stageIndex", self.path_stage),
-            ("coreIndex", self.path_core),
-            ("curatedIndex", self.path_curated),
-        ]
-        return ls_index_items
+        # Built once per instance; every entry resolves a zone path
+        # through the solution object and the callers iterate this list
+        # inside the index scan loops.
+        if self.__index_items is None:
+            self.__index_items = [
+                ("rawIndex", self.path_raw),
+                ("stageIndex", self.path_stage),
+                ("coreIndex", self.path_core),
+                ("curatedIndex", self.path_curated),
+            ]
+        return self.__index_items
 
     def __get_index_entry(self, path: str) -> dict:
         ls_idx_entry = []
         for subdir, dirs, files in os.walk(path):
-            json_files = [f for f in files if f.endswith(".json")]
+            for file in files:
+                if not file.endswith(".json"):
+                    continue
 
-            for file in json_files:
                 abspath = os.path.join(subdir, file)
 
                 try:
@@ -372,7 +463,7 @@ class Model:
 
         return __dict
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class IndexTuple:
         index: Index
         locators: list[str]
@@ -381,17 +472,22 @@ class Model:
         try:
             ls_locators = []
 
-            # Get current Index
+            # Get current Index; drop it from the cache because the
+            # refresh below mutates the entry lists in place and the
+            # cached copy has to stay read-only.
             __idx = self.get_index()
+            Model.CACHE_INDEX.pop(
+                (self.path_index, os.path.getmtime(self.path_index)), None
+            )
 
             # Remove invalid index items and add valid to locators list
             for item in self.__get_index_items():
-                for i in getattr(__idx, f"{item[0]}").entry:
+                for i in getattr(__idx, item[0]).entry:
                     if not os.path.exists(i.absPath):
                         self.logger.info(
                             f"Removing deleted file from index: {os.path.basename(i.absPath)}"
                         )
-                        getattr(__idx, f"{item[0]}").entry.remove(i)
+                        getattr(__idx, item[0]).entry.remove(i)
                     else:
                         ls_locators.append(i.locator)
 
@@ -417,6 +513,11 @@ class Model:
 
             for subdir, dirs, files in os.walk(item[1]):
                 for file in files:
+                    # Entity files are JSON; skipping anything else up
+                    # front avoids stat'ing and parsing stray files.
+                    if not file.endswith(".json"):
+                        continue
+
                     abspath = os.path.join(subdir, file)
                     file_name = os.path.basename(abspath)
                     file_change_time = os.path.getmtime(abspath)
@@ -437,8 +538,11 @@ class Model:
                                 "name": _js["entity"]["name"],
                                 "locator": locator,
                             }
-                            e = Index.model_validate_json(json.dumps(entry))
-                            getattr(__idx, f"{item[0]}").entry.append(e)
+                            # The dict is built right above from trusted
+                            # values, so model_construct skips a full
+                            # validation (and the dumps round-trip).
+                            e = IndexEntry.model_construct(**entry)
+                            getattr(__idx, item[0]).entry.append(e)
                             self.logger.info(
                                 f"Adding file to index: {file_name}"
                             )
@@ -450,29 +554,43 @@ class Model:
         return __idx
 
     def __check_index_duplicates(self, idx: Index):
-        ls_locators: list[str] = []
+        # A set keeps the duplicate check O(1) per locator instead of
+        # rescanning a list of all locators seen so far.
+        seen_locators: set[str] = set()
         for item in self.__get_index_items():
-            for i in getattr(idx, f"{item[0]}").entry:
-                if i.locator in ls_locators:
+            for i in getattr(idx, item[0]).entry:
+                if i.locator in seen_locators:
                     raise ValueError(
                         f"Error generating index due to duplicate locator: {i.locator} in file: {i.absPath}"
                     )
                 else:
-                    ls_locators.append(i.locator)
+                    seen_locators.add(i.locator)
+
+    def __get_zone_paths(self) -> dict[str, str]:
+        # Zone name to path mapping built once per instance; each path
+        # resolves through the solution object, so callers that check
+        # several zones should not redo that per call.
+        if self.__zone_paths is None:
+            self.__zone_paths = {
+                "raw": self.path_raw,
+                "stage": self.path_stage,
+                "core": self.path_core,
+                "curated": self.path_curated,
+            }
+        return self.__zone_paths
 
     def check_zone_for_entities(self, zone: str) -> bool:
-        if zone == "raw":
-            path_to_check = self.path_raw
-        elif zone == "stage":
-            path_to_check = self.path_stage
-        elif zone == "core":
-            path_to_check = self.path_core
-        elif zone == "curated":
-            path_to_check = self.path_curated
-        else:
+        path_to_check = self.__get_zone_paths().get(zone)
+        if path_to_check is None:
             raise ValueError("Unknown zone name: %s" % zone)
 
-        return len(self.__get_index_entry(path_to_check)["entry"]) > 0
+        # A lightweight walk is enough here: the zone is non-empty as soon
+        # as one entity file shows up, so no JSON parsing is required.
+        for subdir, dirs, files in os.walk(path_to_check):
+            if any(f.endswith(".json") for f in files):
+                return True
+
+        return False
 
     def validate_index(self, full_index_scan=True):
         try:
@@ -503,8 +621,10 @@ class Model:
                 self.__check_index_duplicates(idx=__idx)
 
                 # Write Index
+                # Serialize to one string first; json.dump would push
+                # many small chunks through the file object instead.
                 with open(self.path_index, "w", encoding="utf-8") as f:
-                    json.dump(idx_dict, f, ensure_ascii=False, indent=4)
+                    f.write(json.dumps(idx_dict, ensure_ascii=False, indent=4))
 
                 self.logger.info("Index has been generated")
 
@@ -515,8 +635,12 @@ class Model:
                 self.__check_index_duplicates(idx=idx_refreshed)
 
                 with open(self.path_index, "w", encoding="utf-8") as f:
-                    json.dump(
-                        idx_refreshed.to_dict(), f, ensure_ascii=False, indent=4
+                    f.write(
+                        json.dumps(
+                            idx_refreshed.to_dict(),
+                            ensure_ascii=False,
+                            indent=4,
+                        )
                     )
 
                 self.logger.info("Index has been refreshed")
@@ -532,19 +656,22 @@ class Model:
         self,
         regex: str = r"^([A-Za-z]*)\/([A-Za-z]*)\/([A-Za-z]*)\/([A-Za-z]*)",
     ) -> list[Index]:
-        if not re.search(r"^\/+.+\/.+\/.+\/.+$", re.escape(regex)):
+        if not _LOCATOR_CHECK_RE.search(re.escape(regex)):
             raise InvalidLocatorException(regex)
 
         ls_locators: list = []
         __idx = self.get_index()
 
+        # Lowercase the search locator once instead of per index entry.
+        regex_lower = regex.lower()
+
         for item in self.__get_index_items():
             for entry in getattr(__idx, item[0]).entry:
                 locator = entry.locator
                 # if re.match(re.escape(regex.lower()), str(locator).lower()):
-                if regex.lower() == str(locator).lower():
+                if regex_lower == str(locator).lower():
                     self.logger.debug(
-                        f"Matching regex locator added: {locator}"
+                        "Matching regex locator added: %s", locator
                     )
                     ls_locators.append(entry)
 
@@ -572,25 +699,25 @@ class Model:
         Arguments:
             locator(str): Locator to lookup in the index, e.g. "/Raw/Sales/Customer/Customer_DE"
         """
-        self.logger.debug("Start looking for locator: %s" % locator)
+        self.logger.debug("Start looking for locator: %s", locator)
 
         if not locator.startswith("/"):
             locator = "/" + locator
 
         layer = locator.lower().split("/")[1]
+        get_entity = {
+            "raw": self.get_raw_entity,
+            "stage": self.get_stage_entity,
+            "core": self.get_core_entity,
+            "curated": self.get_curated_entity,
+        }.get(layer)
 
-        locator_index = self.get_locator(regex=locator)
-        self.logger.debug("Locator Index: %s" % str(locator_index))
+        ls_locator_index = self.get_locator(regex=locator)
+        self.logger.debug("Locator Index: %s", ls_locator_index)
 
-        for locator_index in self.get_locator(regex=locator):
-            if layer == "raw":
-                return self.get_raw_entity(path=locator_index.absPath)
-            elif layer == "stage":
-                return self.get_stage_entity(path=locator_index.absPath)
-            elif layer == "core":
-                return self.get_core_entity(path=locator_index.absPath)
-            elif layer == "curated":
-                return self.get_curated_entity(path=locator_index.absPath)
+        if get_entity is not None:
+            for locator_index in ls_locator_index:
+                return get_entity(path=locator_index.absPath)
 
     def lookup_stage_entity(self, locator: str) -> StageEntityFactory:
         """
@@ -599,13 +726,13 @@ class Model:
         Parameters:
             locator: str = Stage locator to lookup in index (e.g "Stage/Sales/Customer/Customer_DE")
         """
-        self.logger.debug("Start looking for locator: %s" % locator)
+        self.logger.debug("Start looking for locator: %s", locator)
 
         if locator.lower().startswith("/stage"):
-            locator_index = self.get_locator(regex=locator)
-            self.logger.debug("Locator Index: %s" % str(locator_index))
+            ls_locator_index = self.get_locator(regex=locator)
+            self.logger.debug("Locator Index: %s", ls_locator_index)
 
-            for locator_index in self.get_locator(regex=locator):
+            for locator_index in ls_locator_index:
                 return self.get_stage_entity(path=locator_index.absPath)
         else:
             self.logger.warning(
@@ -625,35 +752,39 @@ class Model:
         """
         self.logger.debug("Start performing initial model checks")
 
+        # Read the index once and share it across all layer checks instead
+        # of re-reading it per entity list.
+        index = self.get_index()
+
         if "raw" in layers:
-            self.__perform_raw_checks()
+            self.__perform_raw_checks(index)
 
         if "stage" in layers:
-            self.__perform_stage_checks()
+            self.__perform_stage_checks(index)
 
         if "core" in layers:
-            self.__perform_core_checks()
+            self.__perform_core_checks(index)
 
         if "curated" in layers:
-            self.__perform_curated_checks()
+            self.__perform_curated_checks(index)
 
         self.logger.info("Finished initial model checks")
 
         return 0
 
-    def __perform_raw_checks(self) -> None:
-        raw_entities: list = self.get_raw_entity_list()
+    def __perform_raw_checks(self, index: Index = None) -> None:
+        raw_entities: list = self.get_raw_entity_list(index=index)
 
         self.logger.info("Raw Entities to process: %s" % str(len(raw_entities)))
 
-    def __perform_stage_checks(self) -> None:
-        stage_entities: list = self.get_stage_entity_list()
+    def __perform_stage_checks(self, index: Index = None) -> None:
+        stage_entities: list = self.get_stage_entity_list(index=index)
         self.logger.info(
             "Stage Entities to process: %s" % str(len(stage_entities))
         )
 
-    def __perform_core_checks(self) -> None:
-        core_entities: list = self.get_core_entity_list()
+    def __perform_core_checks(self, index: Index = None) -> None:
+        core_entities: list = self.get_core_entity_list(index=index)
         self.logger.info(
             "Core Entities to process: %s" % str(len(core_entities))
         )
@@ -663,18 +794,18 @@ class Model:
             function = entity.model_object.function
             sources: list = filter(lambda x: x.dm8l != "#", function.source)
 
-            self.logger.debug("Core Table: %s" % table.name)
+            self.logger.debug("Core Table: %s", table.name)
 
             # validate source locators
             for source in sources:
-                self.logger.debug("Source Entity Locator: %s" % source.dm8l)
+                self.logger.debug("Source Entity Locator: %s", source.dm8l)
                 stage_entity = self.lookup_stage_entity(source.dm8l)
                 self.logger.debug(
-                    "Source Entity: %s" % stage_entity.model_object.entity.name
+                    "Source Entity: %s", stage_entity.model_object.entity.name
                 )
 
-    def __perform_curated_checks(self) -> None:
-        curated_entities: list = self.get_curated_entity_list()
+    def __perform_curated_checks(self, index: Index = None) -> None:
+        curated_entities: list = self.get_curated_entity_list(index=index)
         self.logger.info(
             "Curated Entities to process: %s" % str(len(curated_entities))
         )
@@ -683,16 +814,16 @@ class Model:
             table = entity.model_object.entity
             functions = entity.model_object.function
 
-            self.logger.debug("Curated Table: %s" % table.name)
+            self.logger.debug("Curated Table: %s", table.name)
 
             for function in functions:
                 # validate source locators
                 for source in function.source:
-                    self.logger.debug("Source Entity Locator: %s" % source.dm8l)
+                    self.logger.debug("Source Entity Locator: %s", source.dm8l)
                     core_entity = self.lookup_entity(source.dm8l)
                     self.logger.debug(
-                        "Source Entity: %s"
-                        % core_entity.model_object.entity.name
+                        "Source Entity: %s",
+                        core_entity.model_object.entity.name
                     )
 
     class ModelParseException(Exception):
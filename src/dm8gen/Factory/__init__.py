@@ -1,6 +1,25 @@
-from .Model import Model
-from .RawEntityFactory import RawEntityFactory
-from .StageEntityFactory import StageEntityFactory
-from .CoreEntityFactory import CoreEntityFactory
-from .CuratedEntityFactory import CuratedEntityFactory
-from .Jinja2Factory import Jinja2Factory
+import importlib
+
+# Factory classes are re-exported lazily (PEP 562) so that importing
+# the package does not pull in jinja2, sqlparse and autopep8 via
+# Jinja2Factory when only the model factories are needed.
+_LAZY_ATTRIBUTES = {
+    "Model": ".Model",
+    "RawEntityFactory": ".RawEntityFactory",
+    "StageEntityFactory": ".StageEntityFactory",
+    "CoreEntityFactory": ".CoreEntityFactory",
+    "CuratedEntityFactory": ".CuratedEntityFactory",
+    "Jinja2Factory": ".Jinja2Factory",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        attribute = getattr(module, name)
+        globals()[name] = attribute
+        return attribute
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
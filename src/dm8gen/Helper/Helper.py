@@ -3,9 +3,27 @@ import os
 import json
 import hashlib
 import textwrap
+from functools import lru_cache
+from typing import Union
 from uuid import UUID
 from pathlib import Path
-from jsonschema import validate
+from jsonschema import validators
+
+try:
+    # orjson parses noticeably faster than the stdlib; it is optional
+    # and the stdlib parser is used when it is not installed.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Default log directory, resolved once at import time instead of per
+# start_logger call. os.path.join keeps the separators portable.
+_LOG_DIR = os.path.join(str(Path(__file__).resolve().parents[1]), "Logs")
+
+# Compiled schema validators keyed by (path, mtime); building a
+# validator resolves refs and checks the schema, which is wasted work
+# when the same schema file is validated against many documents.
+_VALIDATOR_CACHE: dict = {}
 
 
 class Helper:
@@ -19,14 +37,34 @@ class Helper:
             path_json (str): Path to the JSON file.
             path_json_schema (str): Path to the JSON schema file.
         """
-        with open(path_json, encoding="utf-8") as f:
-            js = json.load(f)
+        with open(path_json, "rb") as f:
+            js = _json_loads(f.read())
+
+        cache_key = (path_json_schema, os.path.getmtime(path_json_schema))
+        validator = _VALIDATOR_CACHE.get(cache_key)
+
+        if validator is None:
+            # Read schema; the BOM is stripped once from the raw bytes
+            # instead of letting the utf-8-sig codec scan for it, and
+            # the lenient stdlib parse is kept as a fallback for
+            # schemas containing control characters.
+            with open(path_json_schema, "rb") as f:
+                raw_schema = f.read().lstrip(b"\xef\xbb\xbf")
+
+            try:
+                js_schema = _json_loads(raw_schema)
+            except ValueError:
+                js_schema = json.loads(
+                    raw_schema.decode("utf-8", errors="ignore"),
+                    strict=False,
+                )
 
-        # Read schema
-        with open(path_json_schema, encoding="utf-8-sig", errors="ignore") as f:
-            js_schema = json.load(f, strict=False)
+            validator_class = validators.validator_for(js_schema)
+            validator_class.check_schema(js_schema)
+            validator = validator_class(js_schema)
+            _VALIDATOR_CACHE[cache_key] = validator
 
-        validate(js, schema=js_schema)
+        validator.validate(js)
 
     @staticmethod
     def read_json(path: str):
@@ -38,14 +76,28 @@ class Helper:
         Returns:
             dict: JSON data.
         """
-        with open(path, encoding="utf-8", mode="r") as f:
+        with open(path, "rb") as f:
             try:
-                __json = json.load(f)
+                __json = _json_loads(f.read())
             except Exception as e:
                 raise JsonFileParseException(e, path)
 
         return __json
 
+    @staticmethod
+    def read_json_bytes(path: str) -> bytes:
+        """Read the raw bytes of a JSON file.
+
+        Args:
+            path (str): Path to the JSON file.
+
+        Returns:
+            bytes: Unparsed file content, suitable for pydantic's
+            model_validate_json.
+        """
+        with open(path, "rb") as f:
+            return f.read()
+
     @staticmethod
     def coalesce(values: list):
         """
@@ -54,6 +106,7 @@ class Helper:
         return next((v for v in values if v is not None), None)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_locator(
         entity_type: str, data_product: str, data_module: str, entity_name: str
     ) -> str:
@@ -74,7 +127,7 @@ class Helper:
     @staticmethod
     def start_logger(
         log_name: str = "template log",
-        log_directory: str = f"{Path(__file__).parents[1]}\\Logs",
+        log_directory: str = _LOG_DIR,
         enable_write_log: bool = False,
         log_level: logging.log = logging.INFO,
     ) -> logging.Logger:
@@ -82,27 +135,37 @@ class Helper:
 
         Args:
             log_name (str, optional): Name of the logger. Defaults to "template log".
-            log_directory (str, optional): Directory to store log files. Defaults to f"{Path(__file__).parents[1]}\\Logs".
+            log_directory (str, optional): Directory to store log files. Defaults to the package-level Logs directory.
             enable_write_log (bool, optional): Enable writing logs to file. Defaults to False.
             log_level (logging.log, optional): Logging level. Defaults to logging.INFO.
 
         Returns:
             logging.Logger: Initialized logger object.
         """
-        log_path = f"{log_directory}\\{log_name}.log"
-
         logger = logging.getLogger(log_name)
         logger.setLevel(log_level)
+        # These loggers carry their own handlers; without this, records
+        # would additionally bubble up to any root handler and print
+        # twice.
+        logger.propagate = False
+
+        # logging.getLogger returns the same logger per name; factories
+        # are constructed many times per run, so bail out once handlers
+        # are attached instead of stacking a new one per construction
+        # (which duplicated every log line).
+        if logger.handlers:
+            return logger
 
         if enable_write_log:
+            log_path = os.path.join(log_directory, f"{log_name}.log")
+
             # Create Log
-            if not os.path.exists(log_directory):
-                os.makedirs(log_directory)
+            os.makedirs(log_directory, exist_ok=True)
 
             # Remove Old Log file
             if os.path.exists(log_path):
                 os.remove(log_path)
-            
+
             formatter = logging.Formatter(
                 "%(asctime)s - %(name)s - %(levelname)s: %(message)s"
             )
@@ -131,7 +194,10 @@ class Helper:
         Returns:
             A instantiated Path object of the parent folder.
         """
-        return Path(path).parent
+        # os.path.dirname only slices the string, so the Path object is
+        # built for the parent component alone instead of parsing the
+        # full path first.
+        return Path(os.path.dirname(path))
 
 
 class ColorFormatter(logging.Formatter):
@@ -152,13 +218,26 @@ class ColorFormatter(logging.Formatter):
         logging.CRITICAL: red + format + reset,
     }
 
+    LEVELNAMES = {
+        logging.WARNING: "WARN",
+        logging.CRITICAL: "ERROR",
+    }
+
+    # One Formatter per level shared by all instances; every factory
+    # logger gets its own ColorFormatter, and the wrapped Formatter
+    # objects are stateless.
+    _FORMATTERS = {
+        level: logging.Formatter(fmt) for level, fmt in FORMATS.items()
+    }
+    _DEFAULT_FORMATTER = logging.Formatter(None)
+
     def format(self, record):
-        record.levelname = "WARN" if record.levelname == "WARNING" else record.levelname
-        record.levelname = (
-            "ERROR" if record.levelname == "CRITICAL" else record.levelname
+        record.levelname = self.LEVELNAMES.get(
+            record.levelno, record.levelname
+        )
+        formatter = self._FORMATTERS.get(
+            record.levelno, self._DEFAULT_FORMATTER
         )
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
         return formatter.format(record)
 
 
@@ -209,7 +288,7 @@ class Cache:
 
     def __str__(self):
         return "Cached Items: " + ", ".join(
-            ["%s(%s)" % (k, str(v["value"])) for k, v in self.__dict.items()]
+            "%s(%s)" % (k, v["value"]) for k, v in self.__dict.items()
         )
 
 
@@ -220,21 +299,28 @@ class Hasher:
         if algorithm not in Hasher.allowed_algorithms:
             raise Hasher.UnknownAlgorithmExpcetion(algorithm)
 
-        self.__algorithm = algorithm
+        # Normalized once here; hash() and create_uuid() are called per
+        # attribute in templates and should not re-uppercase per call.
+        self.__algorithm = algorithm.upper()
 
     @property
     def algorithm(self) -> str:
         return self.__algorithm
 
-    def hash(self, input: str) -> str:
-        input_encoded = input.encode()
+    def hash(self, input: Union[str, bytes]) -> str:
+        # Callers that already hold bytes skip the encode step; the
+        # identifiers hashed here are not security sensitive, so the
+        # FIPS flag lets OpenSSL builds take the faster digest path.
+        input_encoded = input.encode() if isinstance(input, str) else input
 
-        if self.__algorithm.upper() == "SHA256":
-            hash_object = hashlib.sha256(input_encoded)
+        if self.__algorithm == "SHA256":
+            hash_object = hashlib.sha256(
+                input_encoded, usedforsecurity=False
+            )
 
         return hash_object
 
-    def create_uuid(self, input: str) -> str:
+    def create_uuid(self, input: str) -> UUID:
         hash = self.hash(input)
 
         if self.__algorithm == "SHA256":
@@ -1,8 +1,6 @@
-import json
 from typing import Optional, Annotated
 from enum import Enum
 import typer
-from .Factory.Jinja2Factory import Jinja2Factory
 from .Factory.Model import Model
 from .Generated.Solution import Model as Solution
 from .Helper.Helper import Helper
@@ -10,6 +8,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Known log level names resolved once at import time; hasattr/getattr
+# against the logging module would also match non-level attributes.
+_LEVEL_MAP = logging.getLevelNamesMapping()
+
 
 class GenerateOptionEnum(str, Enum):
     """
@@ -108,31 +110,31 @@ def generate(
         Exception: If the solution validation fails or an unknown action is provided.
     """
     # Validate Log level
-    log_level_upper = log_level.upper()
-    if not hasattr(logging, log_level_upper):
+    log_level_int = _LEVEL_MAP.get(log_level.upper())
+    if log_level_int is None:
         log_level_int = logging.INFO
         logger = Helper.start_logger("main", log_level=logging.INFO)
         logger.warning(f"Invalid log level: {log_level} defaulting to INFO")
     else:
-        log_level_int = getattr(logging, log_level_upper)
         Helper.start_logger("main", log_level=log_level_int)
 
     # Validate the provided solution file
-    solution_data = Helper.read_json(path_solution)
-    solution_object = Solution.model_validate_json(json.dumps(solution_data))
+    solution_object = Solution.model_validate_json(
+        Helper.read_json_bytes(path_solution)
+    )
 
-    missing_properties = [
-        (attr, value)
-        for attr, value in solution_object.__dict__.items()
-        if value is None and attr != "name"
-    ]
+    missing_properties = (
+        set(solution_object.model_fields)
+        - solution_object.model_fields_set
+        - {"name"}
+    )
 
     if missing_properties:
         raise Exception(
             f"""
             Unable to read Solution File!
             --------------------------
-            Missing Properties: {missing_properties}
+            Missing Properties: {sorted(missing_properties)}
             """
         )
 
@@ -160,7 +162,11 @@ def generate(
         if action == GenerateOptionEnum.REFRESH_GENERATE:
             model.validate_index(full_index_scan=True)
 
-        # Generate templates using Jinja2Factory
+        # Generate templates using Jinja2Factory; imported here so that
+        # validate_index runs do not pay for jinja2, sqlparse and
+        # autopep8 at startup.
+        from .Factory.Jinja2Factory import Jinja2Factory
+
         jinja_factory = Jinja2Factory(model=model, log_level=log_level_int)
         jinja_factory.generate_template(
             path_template_source=path_template_source,
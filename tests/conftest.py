@@ -48,7 +48,9 @@ def pytest_configure(config: dict):
     model.validate_index(full_index_scan=True)
 
 
-@fixture
+# The dict is derived purely from the immutable session config, so it
+# can be built once per session instead of once per test.
+@fixture(scope="session")
 def config(request) -> dict:
     """DataM8 Solution configuration."""
 
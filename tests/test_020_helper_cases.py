@@ -25,6 +25,16 @@ class HashCases:
                 "test2",
                 "60303ae22b998861bce3b28f33eec1be758a213c86c93c076dbe9f558c11c752",
             ),
+            # bytes input takes the encode-free fast path and must
+            # produce the same digest as the equivalent string
+            (
+                b"test",
+                "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+            ),
+            (
+                b"test2",
+                "60303ae22b998861bce3b28f33eec1be758a213c86c93c076dbe9f558c11c752",
+            ),
         ],
     )
     def case_hashes_valid(self, input):